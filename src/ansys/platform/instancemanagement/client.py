@@ -26,6 +26,29 @@ from ansys.platform.instancemanagement.interceptor import header_adder_intercept
 logger = logging.getLogger(__name__)
 
 
+def _create_channel(configuration: Configuration) -> grpc.Channel:
+    """Create the gRPC channel to the PIM API.
+
+    Parameters
+    ----------
+    configuration : Configuration
+        PyPIM configuration.
+
+    Returns
+    -------
+    grpc.Channel
+        gRPC channel to the PIM API, without the configured headers.
+    """
+    if configuration.tls:
+        logger.debug("The connection to the server will use a secure channel.")
+        channel_credentials = grpc.composite_channel_credentials(
+            grpc.ssl_channel_credentials(),
+            grpc.access_token_call_credentials(configuration.access_token),
+        )
+        return grpc.secure_channel(configuration.uri, channel_credentials)
+    return grpc.insecure_channel(configuration.uri)
+
+
 class Client(contextlib.AbstractContextManager):
     """Provides a high-level client object for interacting with the PIM API.
 
@@ -94,18 +117,8 @@ class Client(contextlib.AbstractContextManager):
 
         configuration = Configuration.from_file(config_path)
 
-        if configuration.tls:
-            logger.debug("The connection to the server will use a secure channel.")
-            channel_credentials = grpc.composite_channel_credentials(
-                grpc.ssl_channel_credentials(),
-                grpc.access_token_call_credentials(configuration.access_token),
-            )
-            grpc_channel = grpc.secure_channel(configuration.uri, channel_credentials)
-        else:
-            grpc_channel = grpc.insecure_channel(configuration.uri)
-
         channel = grpc.intercept_channel(
-            grpc_channel,
+            _create_channel(configuration),
             header_adder_interceptor(configuration.headers),
         )
 
@@ -243,6 +243,9 @@ class Instance(contextlib.AbstractContextManager):
 
         The instance must be ready before calling this method.
 
+        When no named arguments are given, the channel is shared by all calls
+        for the same service. It is released with :func:`~Service.close()`.
+
         Parameters
         ----------
         service_name : str, optional
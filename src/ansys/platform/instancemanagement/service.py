@@ -1,5 +1,6 @@
 """Service class module."""
 
+import threading
 from typing import Mapping
 
 from ansys.api.platform.instancemanagement.v1.product_instance_manager_pb2 import (
@@ -16,6 +17,9 @@ class Service:
 
     _uri: str
     _headers: Mapping[str, str]
+    _channel: grpc.Channel
+    _channel_configuration: Configuration
+    _channel_lock: threading.Lock
 
     @property
     def uri(self) -> str:
@@ -45,6 +49,9 @@ class Service:
         """Create a Service."""
         self._uri = uri
         self._headers = headers
+        self._channel = None
+        self._channel_configuration = None
+        self._channel_lock = threading.Lock()
 
     def __eq__(self, obj):
         """Test for equality."""
@@ -54,6 +61,17 @@ class Service:
         """Python callable representation."""
         return f"Service(uri={repr(self.uri)}, headers={repr(self.headers)})"
 
+    def close(self):
+        """Close the gRPC channel cached by this service, if any.
+
+        The next call to build a gRPC channel creates a new one.
+        """
+        with self._channel_lock:
+            if self._channel is not None:
+                self._channel.close()
+            self._channel = None
+            self._channel_configuration = None
+
     def _build_grpc_channel(
         self,
         configuration: Configuration = None,
@@ -61,6 +79,10 @@ class Service:
     ) -> grpc.Channel:
         """Build a gRPC channel communicating with the product instance.
 
+        When no named arguments are given, the channel is built once and reused
+        by subsequent calls with the same configuration. Call :func:`~close()`
+        to release it.
+
         Parameters
         -----------
         configuration: pim configuration
@@ -73,8 +95,22 @@ class Service:
         grpc.Channel
             gRPC channel ready to be used for communicating with the service.
         """
-        headers = self.headers.items()
-        interceptor = header_adder_interceptor(headers)
+        if kwargs:
+            return self._create_grpc_channel(configuration, **kwargs)
+
+        with self._channel_lock:
+            if self._channel is None or self._channel_configuration is not configuration:
+                self._channel = self._create_grpc_channel(configuration)
+                self._channel_configuration = configuration
+            return self._channel
+
+    def _create_grpc_channel(
+        self,
+        configuration: Configuration = None,
+        **kwargs,
+    ) -> grpc.Channel:
+        """Create a new intercepted gRPC channel for the service."""
+        interceptor = header_adder_interceptor(tuple(self.headers.items()))
 
         if configuration is not None and configuration.tls:
             credentials = grpc.composite_channel_credentials(
@@ -102,4 +138,4 @@ class Service:
             The PyPIM service
             PyPIM service definition.
         """
-        return Service(uri=service.uri, headers=service.headers)
+        return Service(uri=service.uri, headers=dict(service.headers))
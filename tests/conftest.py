@@ -4,6 +4,7 @@ from ansys.api.platform.instancemanagement.v1.product_instance_manager_pb2 impor
 import grpc_testing
 import pytest
 
+PIM_SERVICES = tuple(DESCRIPTOR.services_by_name.values())
 PIM_SERVICE = DESCRIPTOR.services_by_name["ProductInstanceManager"]
 LIST_DEFINITIONS_METHOD = PIM_SERVICE.methods_by_name["ListDefinitions"]
 CREATE_INSTANCE_METHOD = PIM_SERVICE.methods_by_name["CreateInstance"]
@@ -12,19 +13,22 @@ GET_INSTANCE_METHOD = PIM_SERVICE.methods_by_name["GetInstance"]
 LIST_INSTANCES_METHOD = PIM_SERVICE.methods_by_name["ListInstances"]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def testing_pool():
-    """A thread pool with two workers (client and server)."""
+    """A thread pool with two workers (client and server), shared by the session."""
     pool = ThreadPoolExecutor(max_workers=2)
     yield pool
     pool.shutdown(wait=False)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def testing_channel():
-    """A gRPC channel for use in tests."""
+    """A gRPC channel for use in tests, shared by the session.
+
+    Each test must fully drain the RPCs it issues.
+    """
     channel = grpc_testing.channel(
-        DESCRIPTOR.services_by_name.values(),
+        PIM_SERVICES,
         grpc_testing.strict_real_time(),
     )
     yield channel
@@ -3,7 +3,6 @@ import os
 from unittest.mock import create_autospec, patch
 
 from ansys.api.platform.instancemanagement.v1 import product_instance_manager_pb2 as pb2
-from ansys.api.platform.instancemanagement.v1 import product_instance_manager_pb2_grpc as pb2_grpc
 import grpc
 from grpc import StatusCode
 import grpc_testing
@@ -438,28 +437,27 @@ def test_unsupported_product(
     assert "222" in str(no_version_exception)
 
 
-def test_initialize_from_configuration(testing_pool, tmp_path):
+def test_initialize_from_configuration(testing_pool, testing_channel, tmp_path, monkeypatch):
     # Arrange
-    # A basic implementation of PIM able to list definitions
-    received_metadata = []
+    # A PIM channel served in-process
+    monkeypatch.setattr(
+        "ansys.platform.instancemanagement.client._create_channel",
+        lambda configuration: testing_channel,
+    )
 
-    class PIMServicer(pb2_grpc.ProductInstanceManagerServicer):
-        def ListDefinitions(self, _, context):
-            received_metadata.append(context.invocation_metadata())
-            return pb2.ListDefinitionsResponse()
+    def server():
+        metadata, _, rpc = testing_channel.take_unary_unary(LIST_DEFINITIONS_METHOD)
+        rpc.terminate(pb2.ListDefinitionsResponse(), [], StatusCode.OK, "")
+        return metadata
 
-    server = grpc.server(testing_pool)
-    pb2_grpc.add_ProductInstanceManagerServicer_to_server(PIMServicer(), server)
+    server_future = testing_pool.submit(server)
 
-    port = server.add_insecure_port("127.0.0.1:0")
-    server.start()
     # A valid configuration file setting up the uri and metadata
     config_path = str(tmp_path / "config.json")
-    config = (
-        r"""{
+    config = r"""{
     "version": 1,
     "pim": {
-        "uri": "dns:127.0.0.1:%s",
+        "uri": "dns:127.0.0.1:50051",
         "headers": {
             "token": "007",
             "identity": "james bond"
@@ -467,8 +465,6 @@ def test_initialize_from_configuration(testing_pool, tmp_path):
         "tls": false
     }
 }"""
-        % port
-    )
 
     with open(config_path, "w") as f:
         f.write(config)
@@ -482,8 +478,7 @@ def test_initialize_from_configuration(testing_pool, tmp_path):
 
     # Assert
     # The server got the request with the intended headers
-    assert len(received_metadata) == 1
-    received_metadata_dict = dict(received_metadata[0])
+    received_metadata_dict = dict(server_future.result())
     assert received_metadata_dict["token"] == "007"
     assert received_metadata_dict["identity"] == "james bond"
 
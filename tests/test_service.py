@@ -13,6 +13,7 @@ def test_from_pim_v1_proto():
     )
     assert service.uri == "dns://some-service"
     assert service.headers == {"token": "some-token"}
+    assert type(service.headers) is dict
 
 
 @pytest.mark.parametrize("headers", [{}, {"a": "b"}, {"my-token": "value", "identity": "thing"}])
@@ -40,10 +41,11 @@ def test_build_channel(testing_pool, headers):
     # Act
     # Build a grpc channel from the service,
     # and send a message
-    with service._build_grpc_channel() as channel:
-        stub = health_pb2_grpc.HealthStub(channel)
-        request = health_pb2.HealthCheckRequest(service="hello world")
-        stub.Check(request)
+    channel = service._build_grpc_channel()
+    stub = health_pb2_grpc.HealthStub(channel)
+    request = health_pb2.HealthCheckRequest(service="hello world")
+    stub.Check(request)
+    service.close()
 
     server.stop(grace=0.1)
 
@@ -62,6 +64,43 @@ def test_build_channel(testing_pool, headers):
     assert received_requests[0] == health_pb2.HealthCheckRequest(service="hello world")
 
 
+def test_build_channel_reused():
+    # Arrange
+    # A service
+    service = pypim.Service(uri="dns:example.com", headers={"a": "b"})
+
+    # Act
+    # Build the channel twice, then close it and build it again
+    channel1 = service._build_grpc_channel()
+    channel2 = service._build_grpc_channel()
+    service.close()
+    channel3 = service._build_grpc_channel()
+    service.close()
+
+    # Assert
+    # The channel was reused until the service was closed
+    assert channel1 is channel2
+    assert channel3 is not channel1
+
+
+def test_build_channel_with_arguments_not_reused():
+    # Arrange
+    # A service with a cached channel
+    service = pypim.Service(uri="dns:example.com", headers={})
+    cached_channel = service._build_grpc_channel()
+
+    # Act
+    # Build a channel with custom options
+    channel = service._build_grpc_channel(options=[("grpc.max_receive_message_length", 1024)])
+
+    # Assert
+    # A dedicated channel was created and the cached one was kept
+    assert channel is not cached_channel
+    assert service._build_grpc_channel() is cached_channel
+    channel.close()
+    service.close()
+
+
 def test_str():
     service_str = str(pypim.Service(uri="http://example.com", headers={"hello": "world"}))
     assert "http://example.com" in service_str